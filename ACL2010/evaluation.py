@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+
+import numpy as np
+
+LABELS = ["yes", "no", "uncertain"]
+
+class EvaluationReport:
+    """Accuracy, confusion matrices, per-category breakdowns, and paired
+    bootstrap confidence intervals for one or more predictions sets, as
+    produced by the Evaluator.with_* methods. The predictions are turned
+    into arrays once, in the order of dialogues, and everything else is
+    computed from those arrays."""
+    def __init__(self, dialogues, predictions_sets, n_samples=10000, seed=0, alpha=0.05):
+        self.methods = [method for predictions, method in predictions_sets]
+        self.n_samples = n_samples
+        self.seed = seed
+        self.alpha = alpha
+        label_index = dict((label, i) for i, label in enumerate(LABELS))
+        hitids = [dialogue.hitid for dialogue in dialogues]
+        # Gold labels are taken from the predictions themselves so that the
+        # report agrees with create_predictions_file.
+        first = predictions_sets[0][0]
+        self.gold = np.array([label_index[first[hitid][0]] for hitid in hitids])
+        self.predicted = np.array([
+            [label_index[predictions[hitid][1]] for hitid in hitids]
+            for predictions, method in predictions_sets])
+        self.correct = self.predicted == self.gold
+        self.categories = {
+            "classification": np.array([dialogue.classification for dialogue in dialogues]),
+            "tri_dominant_answer": np.array([LABELS[i] for i in self.gold])}
+        self.__bootstrap = None
+
+    def accuracy(self):
+        return dict(zip(self.methods, self.correct.mean(axis=1)))
+
+    def confusion_matrix(self, method):
+        """Rows are gold labels and columns predicted labels, both ordered as LABELS."""
+        k = len(LABELS)
+        predicted = self.predicted[self.methods.index(method)]
+        return np.bincount(self.gold * k + predicted, minlength=k*k).reshape(k, k)
+
+    def accuracy_by(self, fieldname):
+        """Per-category counts and accuracies for fieldname, which is
+        'classification' or 'tri_dominant_answer'. Returns a dict mapping
+        each category value to [count, {method: accuracy}]."""
+        values, inverse = np.unique(self.categories[fieldname], return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(values))
+        breakdown = {}
+        for j, value in enumerate(values):
+            breakdown[value] = [counts[j], {}]
+        for i, method in enumerate(self.methods):
+            hits = np.bincount(inverse, weights=self.correct[i], minlength=len(values))
+            for j, value in enumerate(values):
+                breakdown[value][1][method] = hits[j] / float(counts[j])
+        return breakdown
+
+    def bootstrap_accuracies(self):
+        """Array of shape (len(methods), n_samples) with the accuracy of
+        every method on every resample. All methods share the same resampled
+        dialogues, so the rows can be compared pairwise."""
+        if self.__bootstrap is None:
+            rng = np.random.RandomState(self.seed)
+            n = self.correct.shape[1]
+            indices = rng.randint(0, n, size=(self.n_samples, n))
+            self.__bootstrap = self.correct[:, indices].mean(axis=2)
+        return self.__bootstrap
+
+    def confidence_intervals(self):
+        """Percentile bootstrap interval for each method's accuracy."""
+        bounds = self.__percentiles(self.bootstrap_accuracies())
+        return dict(zip(self.methods, bounds))
+
+    def paired_difference(self, method_a, method_b):
+        """Observed accuracy difference (method_a - method_b), its bootstrap
+        interval, and the share of resamples in which method_a does not beat
+        method_b."""
+        a = self.methods.index(method_a)
+        b = self.methods.index(method_b)
+        observed = self.correct[a].mean() - self.correct[b].mean()
+        diffs = self.bootstrap_accuracies()[a] - self.bootstrap_accuracies()[b]
+        low, high = self.__percentiles(diffs[np.newaxis, :])[0]
+        return observed, low, high, np.mean(diffs <= 0)
+
+    def __percentiles(self, samples):
+        q = [100 * self.alpha / 2.0, 100 * (1 - self.alpha / 2.0)]
+        return [tuple(row) for row in np.percentile(samples, q, axis=1).T]
+
+    def print_report(self):
+        level = int(round(100 * (1 - self.alpha)))
+        accuracy = self.accuracy()
+        intervals = self.confidence_intervals()
+        for method in self.methods:
+            print("\n%s" % method)
+            low, high = intervals[method]
+            print("accuracy\t%0.3f (%s%% CI %0.3f-%0.3f)" % (accuracy[method], level, low, high))
+            print("gold\\predicted\t%s" % "\t".join(LABELS))
+            for label, row in zip(LABELS, self.confusion_matrix(method)):
+                print("%s\t%s" % (label, "\t".join(map(str, row))))
+        for fieldname in sorted(self.categories):
+            print("\n%s" % fieldname)
+            print("\t".join(["category", "n"] + self.methods))
+            for value, vals in sorted(self.accuracy_by(fieldname).items()):
+                count, accuracies = vals
+                cells = ["%0.3f" % accuracies[method] for method in self.methods]
+                print("\t".join([value, str(count)] + cells))
+        for i, method_a in enumerate(self.methods):
+            for method_b in self.methods[i+1: ]:
+                observed, low, high, p = self.paired_difference(method_a, method_b)
+                print("\n%s - %s" % (method_a, method_b))
+                print("difference\t%0.3f (%s%% CI %0.3f-%0.3f; p=%0.4f)" % (observed, level, low, high, p))
@@ -18,5 +18,6 @@ def assess_imdb():
     maxs_predictions = e.with_maxs()
     sentiment_predictions = e.with_wordnet()
     e.create_predictions_file([means_predictions, "means"], [sentiment_predictions, "sentiment"])
+    e.evaluation_report([means_predictions, "means"], [sentiment_predictions, "sentiment"]).print_report()
 
 assess_imdb()
@@ -2,6 +2,7 @@
 
 from collections import defaultdict
 import csv
+from evaluation import EvaluationReport
 from glob import glob
 import numpy as np
 from operator import itemgetter
@@ -130,6 +131,9 @@ class Evaluator:
                 per = float(count)/float(sum(counts.values()))
                 print("%s\t%s (%s)" % (verdict,count,per))
 
+    def evaluation_report(self, *predictions_sets, **kwargs):
+        return EvaluationReport(self.annotations.dialogues, predictions_sets, **kwargs)
+
             
 ######################################################################
 